@@ -2,9 +2,9 @@
 
 import argparse
 import sys
+from functools import lru_cache
 from typing import List, Optional
 
-from salary_reporter.data_loader import CSVDataLoader
 from salary_reporter.exceptions import SalaryReporterError
 from salary_reporter.reporting.registry import (
     get_available_reports,
@@ -12,15 +12,16 @@ from salary_reporter.reporting.registry import (
 )
 
 
-def parse_arguments(args: Optional[List[str]] = None) -> argparse.Namespace:
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     """
-    Parses command-line arguments.
+    Builds the command-line argument parser.
 
-    Args:
-        args: Optional list of arguments to parse. Defaults to sys.argv[1:].
+    The parser is built once and reused, as constructing it is comparatively
+    expensive and parsing does not modify it.
 
     Returns:
-        An argparse.Namespace object containing the parsed arguments.
+        The configured argparse.ArgumentParser.
     """
     parser = argparse.ArgumentParser(
         description="Generates salary reports from CSV files."
@@ -46,6 +47,25 @@ def parse_arguments(args: Optional[List[str]] = None) -> argparse.Namespace:
     # parser.add_argument(
     #     "--output-format", type=str, default="console", choices=["console", "json"]
     # )
+    return parser
+
+
+def parse_arguments(
+    args: Optional[List[str]] = None,
+    parser: Optional[argparse.ArgumentParser] = None,
+) -> argparse.Namespace:
+    """
+    Parses command-line arguments.
+
+    Args:
+        args: Optional list of arguments to parse. Defaults to sys.argv[1:].
+        parser: Optional parser to use. Defaults to the shared CLI parser.
+
+    Returns:
+        An argparse.Namespace object containing the parsed arguments.
+    """
+    if parser is None:
+        parser = _build_parser()
     return parser.parse_args(args)
 
 
@@ -62,6 +82,9 @@ def main_logic(args: argparse.Namespace) -> str:
     Raises:
         SalaryReporterError: If any error occurs during the process.
     """
+    # Imported here so that argument parsing (e.g. --help) stays fast
+    from salary_reporter.data_loader import CSVDataLoader
+
     data_loader = CSVDataLoader()
     employee_data = data_loader.load_all_data(args.csv_files)
 
@@ -12,5 +12,3 @@ POSSIBLE_HOURLY_RATE_COLUMNS: Tuple[str, ...] = (
     "rate",
     "salary",
 )
-
-EXPECTED_COLUMNS: int = 6  # id,email,name,department,hours_worked,hourly_rate
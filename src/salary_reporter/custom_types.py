@@ -1,25 +1,39 @@
 """Custom type aliases used across the application."""
 
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, NamedTuple, TypedDict
 
 from salary_reporter.domain_models import EmployeeData
 
 
-class EmployeePayoutDetail(TypedDict):
+class EmployeePayoutDetail(NamedTuple):
     """Structure for individual employee payout details in a report."""
 
     name: str
     hours: int
-    rate: str  # Formatted rate
-    payout: str  # Formatted payout
+    rate: int  # Rate in cents
+    payout: int  # Payout in cents
 
 
-class DepartmentPayoutSummary(TypedDict):
-    """Structure for department-level payout summaries."""
+class _DepartmentPayoutTotals(TypedDict):
+    """Required keys of a department-level payout summary."""
 
     employees: List[EmployeePayoutDetail]
     total_hours: int
-    total_payout: str  # Formatted total payout
+    total_payout: int  # Total payout in cents
+
+
+class DepartmentPayoutSummary(_DepartmentPayoutTotals, total=False):
+    """
+    Structure for department-level payout summaries.
+
+    Hours, rates and payouts are non-negative, as enforced by the data loader.
+    The optional keys are column-width hints filled in by
+    PayoutReportGenerator; the console formatter computes them itself when
+    they are absent.
+    """
+
+    longest_name: int  # Length of the longest employee name
+    max_rate: int  # Highest hourly rate in cents
 
 
 # Defines the structure of the raw data generated by PayoutReportGenerator
@@ -1,14 +1,17 @@
 """
 Handles loading and parsing of employee data from CSV files.
 
-This module provides functionality to read CSV files line by line,
-without using the standard `csv` module, parse headers to find
-required columns (including variants for hourly rate), and convert
-row data into `EmployeeData` objects.
+This module provides functionality to stream CSV files row by row
+with the standard `csv` module, parse headers to find required columns
+(including variants for hourly rate), and convert row data into
+`EmployeeData` objects.
 """
 
+import csv
+import sys
 from decimal import Decimal, InvalidOperation
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, TextIO, Tuple
 
 from salary_reporter import config
 from salary_reporter.domain_models import EmployeeData
@@ -20,162 +23,257 @@ from salary_reporter.exceptions import (
 )
 
 
+def _parse_cents(value: str) -> int:
+    """
+    Parses a monetary amount into cents.
+
+    Plain decimals are parsed directly; rarer forms accepted by Decimal,
+    such as exponents ("5e1"), fall back to it. Zeros past the second
+    decimal place are ignored, e.g. "50.250" is 5025 cents.
+
+    Args:
+        value: The amount as written in the CSV, e.g. "50" or "50.25".
+
+    Returns:
+        The amount in cents, e.g. 5000 or 5025.
+
+    Raises:
+        ValueError: If the value is not a valid amount or has non-zero digits
+            past the second decimal place.
+    """
+    if value.isdigit():  # Fast path for whole amounts, the common case
+        return int(value) * 100
+
+    digits = value[1:] if value[:1] in ("-", "+") else value
+    whole, _, fraction = digits.partition(".")
+    if (whole or fraction) and (whole + fraction).isdigit():
+        if len(fraction) > 2:
+            if fraction[2:].strip("0"):
+                raise ValueError(
+                    f"monetary amount '{value}' has more than two decimal places"
+                )
+            fraction = fraction[:2]
+        cents = int(whole or "0") * 100 + int(fraction.ljust(2, "0"))
+        return -cents if value[:1] == "-" else cents
+
+    try:
+        cents_amount = Decimal(value).scaleb(2)
+        if not cents_amount.is_finite():
+            raise InvalidOperation
+    except ArithmeticError:  # InvalidOperation, or Overflow for huge exponents
+        raise ValueError(f"invalid monetary amount: '{value}'") from None
+    if cents_amount != cents_amount.to_integral_value():
+        raise ValueError(f"monetary amount '{value}' has more than two decimal places")
+    return int(cents_amount)
+
+
+class ColumnLayout(NamedTuple):
+    """Column indices of the required fields within a CSV file."""
+
+    employee_id: int
+    email: int
+    name: int
+    department: int
+    hours_worked: int
+    hourly_rate: int
+
+
+# Pairs of (column purpose, normalized possible column names)
+RequiredColumnFinders = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+
+def _find_column_index(
+    header: Tuple[str, ...],
+    header_index: Dict[str, int],
+    possible_names: Tuple[str, ...],
+    column_purpose: str,
+) -> int:
+    """
+    Finds the index of a column in the header given possible names.
+
+    Args:
+        header: The column names from the CSV header.
+        header_index: A mapping of normalized column names to their indices.
+        possible_names: A tuple of normalized possible names for the column.
+        column_purpose: A descriptive name for the column's purpose (for errors).
+
+    Returns:
+        The 0-based index of the found column.
+
+    Raises:
+        MissingColumnError: If the column cannot be found.
+    """
+    for name_variant in possible_names:
+        index = header_index.get(name_variant)
+        if index is not None:
+            return index
+    raise MissingColumnError(
+        f"Required column for '{column_purpose}' "
+        f"(e.g., {possible_names[0]}) not found in header: {list(header)}"
+    )
+
+
+@lru_cache(maxsize=256)
+def _resolve_column_layout(
+    header: Tuple[str, ...], required_column_finders: RequiredColumnFinders
+) -> ColumnLayout:
+    """
+    Maps each required column purpose to its index in the header.
+
+    Results are cached, so files sharing a header are only resolved once.
+
+    Args:
+        header: The stripped column names from the CSV header.
+        required_column_finders: The column purposes and their possible names.
+
+    Returns:
+        A ColumnLayout holding the column index of each required field.
+
+    Raises:
+        MissingColumnError: If any essential column cannot be mapped.
+    """
+    # The first occurrence wins when a column name is repeated.
+    header_index: Dict[str, int] = {}
+    for index, column_name in enumerate(header):
+        header_index.setdefault(column_name.lower(), index)
+
+    return ColumnLayout(
+        *(
+            _find_column_index(header, header_index, possible_names, purpose)
+            for purpose, possible_names in required_column_finders
+        )
+    )
+
+
 class CSVDataLoader:
     """Loads employee data from one or more CSV files."""
 
     def __init__(self) -> None:
         """Initializes the CSVDataLoader."""
-        self._required_column_finders: Dict[str, Tuple[str, ...]] = {
-            "employee_id": config.POSSIBLE_ID_COLUMNS,
-            "email": config.POSSIBLE_EMAIL_COLUMNS,
-            "name": config.POSSIBLE_NAME_COLUMNS,
-            "department": config.POSSIBLE_DEPARTMENT_COLUMNS,
-            "hours_worked": config.POSSIBLE_HOURS_WORKED_COLUMNS,
-            "hourly_rate": config.POSSIBLE_HOURLY_RATE_COLUMNS,
-        }
-
-    def _find_column_index(
-        self, header: List[str], possible_names: Tuple[str, ...], column_purpose: str
-    ) -> int:
-        """
-        Finds the index of a column in the header given possible names.
-
-        Args:
-            header: A list of column names from the CSV header.
-            possible_names: A tuple of possible names for the target column.
-            column_purpose: A descriptive name for the column's purpose (for errors).
-
-        Returns:
-            The 0-based index of the found column.
-
-        Raises:
-            MissingColumnError: If the column cannot be found.
-        """
-        normalized_header = [h.lower().strip() for h in header]
-        for name_variant in possible_names:
-            try:
-                return normalized_header.index(name_variant.lower().strip())
-            except ValueError:
-                continue
-        raise MissingColumnError(
-            f"Required column for '{column_purpose}' "
-            f"(e.g., {possible_names[0]}) not found in header: {header}"
+        # Candidate names are normalized once here rather than for every file.
+        self._required_column_finders: RequiredColumnFinders = tuple(
+            (purpose, tuple(name.lower().strip() for name in possible_names))
+            for purpose, possible_names in (
+                ("employee_id", config.POSSIBLE_ID_COLUMNS),
+                ("email", config.POSSIBLE_EMAIL_COLUMNS),
+                ("name", config.POSSIBLE_NAME_COLUMNS),
+                ("department", config.POSSIBLE_DEPARTMENT_COLUMNS),
+                ("hours_worked", config.POSSIBLE_HOURS_WORKED_COLUMNS),
+                ("hourly_rate", config.POSSIBLE_HOURLY_RATE_COLUMNS),
+            )
         )
 
-    def _parse_header(self, header_line: str) -> Dict[str, int]:
+    def _parse_header(self, header_row: List[str]) -> ColumnLayout:
         """
-        Parses the header line to map column purposes to their indices.
+        Parses the header row to map column purposes to their indices.
 
         Args:
-            header_line: The string containing the header row from the CSV.
+            header_row: The fields of the header row from the CSV.
 
         Returns:
-            A dictionary mapping column purpose (e.g., "name") to its column index.
+            A ColumnLayout holding the column index of each required field.
 
         Raises:
+            MissingHeaderError: If the header has too few columns.
             MissingColumnError: If any essential column cannot be mapped.
         """
-        header_parts = [part.strip() for part in header_line.split(",")]
+        header_parts = tuple(part.strip() for part in header_row)
         if not header_parts or len(header_parts) < 3:
             raise MissingHeaderError("CSV header is missing or invalid.")
 
-        column_indices: Dict[str, int] = {}
-        for purpose, possible_names in self._required_column_finders.items():
-            column_indices[purpose] = self._find_column_index(
-                header_parts, possible_names, purpose
-            )
-        return column_indices
-
-    def _parse_row(
-        self,
-        row_line: str,
-        column_indices: Dict[str, int],
-        line_number: int,
-        file_path: str,
-    ) -> EmployeeData:
+        return _resolve_column_layout(header_parts, self._required_column_finders)
+
+    def load_data_from_stream(
+        self, stream: TextIO, source_name: str
+    ) -> List[EmployeeData]:
         """
-        Parses a single data row into an EmployeeData object.
+        Loads and parses all employee data from an open text stream.
 
         Args:
-            row_line: The string containing a data row from the CSV.
-            column_indices: A dictionary mapping column purposes to their indices.
-            line_number: The current line number in the file (for error reporting).
-            file_path: The path to the current CSV file (for error reporting).
+            stream: A text stream positioned at the start of the CSV data.
+                Files should be opened with newline="" as the csv module expects.
+            source_name: A name for the data source, used in error messages.
 
         Returns:
-            An EmployeeData object.
+            A list of EmployeeData objects.
 
         Raises:
-            DataParsingError: If data cannot be converted to the expected types
-                              or if a row has an incorrect number of columns.
+            MissingHeaderError:
+                If the CSV header is missing or invalid.
+            MissingColumnError:
+                If essential columns are not found in the header.
+            DataParsingError:
+                If data rows cannot be parsed or the CSV is malformed.
         """
-        row_parts = [part.strip() for part in row_line.split(",")]
-
-        if (
-            len(row_parts) != len(column_indices)
-            and len(row_parts) != config.EXPECTED_COLUMNS
-        ):
-            # This check is a bit lenient
-            # if column_indices has less than EXPECTED_COLUMNS
-
-            # because some headers
-            # might have more columns than we strictly need.
-
-            # A stricter check might be:
-            # len(row_parts) != max(column_indices.values()) + 1
-
-            # For now, assume
-            # row length should match the number of columns defined in header.
-
-            # A more robust parser would handle quoted commas,
-            # but this is per spec "no csv module".
-
-            # This check also assumes
-            # number of found columns in header is consistent with row_parts
-
-            pass
-            # The problem implies "valid CSV",
-            # so we assume correct number of fields.
-
+        records: List[EmployeeData] = []
+        reader = csv.reader(stream)
         try:
-            employee_id = row_parts[column_indices["employee_id"]]
-            email = row_parts[column_indices["email"]]
-            name = row_parts[column_indices["name"]]
-            department = row_parts[column_indices["department"]]
-            hours_worked_str = row_parts[column_indices["hours_worked"]]
-            hourly_rate_str = row_parts[column_indices["hourly_rate"]]
-
-            hours_worked = int(hours_worked_str)
-
-            # The CSV example uses integers for rates (e.g., 50, 40).
-            # Using Decimal for precision.
+            header_row = next(reader, None)
+            if header_row is None:
+                raise MissingHeaderError(
+                    f"File '{source_name}' is empty or has no header."
+                )
 
-            hourly_rate = Decimal(hourly_rate_str)
+            if not "".join(header_row).strip():
+                raise MissingHeaderError(
+                    f"File '{source_name}' has an empty header line."
+                )
 
-            if hours_worked < 0 or hourly_rate < Decimal(0):
-                raise ValueError("Hours worked and hourly rate cannot be negative.")
+            layout = self._parse_header(header_row)
+            id_i, email_i, name_i, dept_i, hours_i, rate_i = layout
 
-        except IndexError as e:
-            raise DataParsingError(
-                f"Row {line_number} in '{file_path}' "
-                f"has an incorrect number of columns. "
-                f"Expected data for columns: "
-                f"{list(column_indices.keys())}. Row: '{row_line}'"
-            ) from e
-        except (ValueError, InvalidOperation) as e:
+            for row in reader:
+                # Skip empty lines
+                if not row or (len(row) == 1 and not row[0].strip()):
+                    continue
+                try:
+                    hours_worked = int(row[hours_i])
+
+                    # Rates are kept as integer cents for exact arithmetic.
+                    hourly_rate = _parse_cents(row[rate_i].strip())
+
+                    # The payout report sizes its columns from department
+                    # totals, which relies on these never being negative.
+                    if hours_worked < 0 or hourly_rate < 0:
+                        raise ValueError(
+                            "Hours worked and hourly rate cannot be negative."
+                        )
+
+                    records.append(
+                        EmployeeData(
+                            employee_id=row[id_i].strip(),
+                            email=row[email_i].strip(),
+                            name=row[name_i].strip(),
+                            # Few distinct departments: share one string
+                            # object so grouping compares by identity
+                            department=sys.intern(row[dept_i].strip()),
+                            hours_worked=hours_worked,
+                            hourly_rate=hourly_rate,
+                        )
+                    )
+                # Fail fast on a bad row, as per "valid CSV" expectation.
+                except IndexError as e:
+                    raise DataParsingError(
+                        f"Error in file '{source_name}': "
+                        f"Row {reader.line_num} in '{source_name}' "
+                        f"has an incorrect number of columns. "
+                        f"Expected data for columns: "
+                        f"{list(layout._fields)}. Row: '{','.join(row)}'"
+                    ) from e
+                except ValueError as e:
+                    raise DataParsingError(
+                        f"Error in file '{source_name}': "
+                        f"Error parsing data in row {reader.line_num} "
+                        f"in '{source_name}': {e}. Row: '{','.join(row)}'"
+                    ) from e
+        except csv.Error as e:
+            # e.g. unbalanced quotes or a field over csv.field_size_limit()
             raise DataParsingError(
-                f"Error parsing data in row {line_number} in '{file_path}': "
-                f"{e}. Row: '{row_line}'"
+                f"Error in file '{source_name}': "
+                f"Malformed CSV at line {reader.line_num} in '{source_name}': {e}"
             ) from e
 
-        return EmployeeData(
-            employee_id=employee_id,
-            email=email,
-            name=name,
-            department=department,
-            hours_worked=hours_worked,
-            hourly_rate=hourly_rate,
-        )
+        return records
 
     def load_data_from_file(self, file_path: str) -> List[EmployeeData]:
         """
@@ -197,42 +295,14 @@ class CSVDataLoader:
             DataParsingError:
                 If data rows cannot be parsed.
         """
-        records: List[EmployeeData] = []
         try:
-            with open(file_path, encoding="utf-8") as f:
-                lines = f.readlines()
-
-            if not lines:
-                raise MissingHeaderError(
-                    f"File '{file_path}' is empty or has no header."
-                )
-
-            header_line = lines[0].strip()
-            if not header_line:
-                raise MissingHeaderError(
-                    f"File '{file_path}' has an empty header line."
-                )
-
-            column_indices = self._parse_header(header_line)
-
-            for i, line in enumerate(lines[1:], start=2):  # Start from line 2 for data
-                line = line.strip()
-                if not line:  # Skip empty lines
-                    continue
-                try:
-                    records.append(self._parse_row(line, column_indices, i, file_path))
-                except DataParsingError as e:
-                    # Allow continuing if one row is bad? Or fail fast?
-                    # For now, fail fast as per "valid CSV" expectation.
-                    raise DataParsingError(f"Error in file '{file_path}': {e}") from e
-
+            with open(file_path, encoding="utf-8", newline="") as f:
+                return self.load_data_from_stream(f, file_path)
         except FileNotFoundError as e:
             raise DataLoaderError(f"File not found: {file_path}") from e
         except OSError as e:
             raise DataLoaderError(f"Error reading file '{file_path}': {e}") from e
 
-        return records
-
     def load_all_data(self, file_paths: List[str]) -> List[EmployeeData]:
         """
         Loads employee data from multiple CSV files and aggregates them.
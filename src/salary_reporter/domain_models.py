@@ -1,21 +1,22 @@
 """Domain models for the salary reporter."""
 
-from dataclasses import dataclass
-from decimal import Decimal
+from typing import NamedTuple
 
 
-@dataclass(frozen=True)
-class EmployeeData:
+class EmployeeData(NamedTuple):
     """
     Represents a single employee's data record.
 
+    A NamedTuple rather than a dataclass: records are immutable, cheap to
+    construct in bulk and store their fields without a per-instance dict.
+
     Attributes:
         employee_id: The unique identifier for the employee.
         email: The employee's email address.
         name: The employee's full name.
         department: The department the employee belongs to.
         hours_worked: The number of hours worked by the employee.
-        hourly_rate: The employee's hourly rate.
+        hourly_rate: The employee's hourly rate, in cents.
     """
 
     employee_id: str
@@ -23,4 +24,4 @@ class EmployeeData:
     name: str
     department: str
     hours_worked: int
-    hourly_rate: Decimal  # Using Decimal for financial precision
+    hourly_rate: int  # Integer cents keep currency arithmetic exact
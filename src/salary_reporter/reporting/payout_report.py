@@ -5,9 +5,8 @@ Includes the generator for processing data into the payout report structure
 and the formatter for console output.
 """
 
-from collections import defaultdict
-from decimal import Decimal
-from typing import Dict, List
+from operator import attrgetter
+from typing import Any, Dict, List
 
 from salary_reporter.custom_types import (
     DepartmentPayoutSummary,
@@ -15,12 +14,27 @@ from salary_reporter.custom_types import (
     EmployeePayoutDetail,
     PayoutReportData,
 )
-from salary_reporter.domain_models import EmployeeData
 from salary_reporter.reporting.base import (
     ReportFormatterStrategy,
     ReportGeneratorStrategy,
 )
 
+_NAME_PREFIX = "---------------- "
+_BY_NAME = attrgetter("name")  # C-level sort key, no Python call per item
+
+
+def _format_cents(cents: int) -> str:
+    """Renders an amount in cents with two decimal places, e.g. "50.25"."""
+    return f"{cents // 100}.{cents % 100:02d}"
+
+
+def _round_cents(cents: int) -> int:
+    """Rounds an amount in cents to whole units, rounding half to even."""
+    units, remainder = divmod(cents, 100)
+    if remainder > 50 or (remainder == 50 and units % 2):
+        units += 1
+    return units
+
 
 class PayoutReportGenerator(
     ReportGeneratorStrategy[EmployeeDataList, PayoutReportData]
@@ -39,61 +53,48 @@ class PayoutReportGenerator(
         Returns:
             A dictionary where keys are department names. Each value is
             another dictionary containing a list of employee payout details
-            and department totals.
+            and department totals. Monetary amounts are integer cents.
         """
-        department_data: Dict[str, Dict[str, List[EmployeeData] | Decimal | int]] = (
-            defaultdict(
-                lambda: {"employees": [], "total_hours": 0, "total_payout": Decimal(0)}
-            )
-        )
+        # Per department: [employee payout details, total hours, total payout,
+        # longest name length, highest rate]
+        department_data: Dict[str, List[Any]] = {}
 
         for emp in data:
-            department_data[emp.department]["employees"].append(emp)
-
+            payout = emp.hours_worked * emp.hourly_rate
+            bucket = department_data.get(emp.department)
+            if bucket is None:
+                bucket = department_data[emp.department] = [[], 0, 0, 0, 0]
+            # Rate and payout are string formatted by the formatter
+            bucket[0].append(
+                EmployeePayoutDetail(
+                    emp.name, emp.hours_worked, emp.hourly_rate, payout
+                )
+            )
+            bucket[1] += emp.hours_worked
+            bucket[2] += payout
+            # Track what the formatter needs for column widths while we are here
+            if len(emp.name) > bucket[3]:
+                bucket[3] = len(emp.name)
+            if emp.hourly_rate > bucket[4]:
+                bucket[4] = emp.hourly_rate
+
+        # Departments are inserted in name order, so the report iterates sorted
         processed_report: PayoutReportData = {}
-        for dept_name, semp_list_and_totals in department_data.items():
-            employees_in_dept = semp_list_and_totals["employees"]
-            if not isinstance(employees_in_dept, list):  # Type guard for mypy
-                continue
-
-            dept_summary: DepartmentPayoutSummary = {
-                "employees": [],
-                "total_hours": 0,
-                "total_payout": Decimal(0),  # Store as Decimal for sum
-            }
-
-            current_dept_total_hours = 0
-            current_dept_total_payout = Decimal(0)
-
+        for dept_name in sorted(department_data):
+            employees, total_hours, total_payout, longest_name, max_rate = (
+                department_data[dept_name]
+            )
             # Sort employees by name within the department for consistent output
-            sorted_employees = sorted(employees_in_dept, key=lambda e: e.name)
-
-            for emp_record in sorted_employees:
-                payout = emp_record.hours_worked * emp_record.hourly_rate
-                dept_summary["employees"].append(
-                    EmployeePayoutDetail(
-                        name=emp_record.name,
-                        hours=emp_record.hours_worked,
-                        # Rate and payout will be string formatted by the formatter
-                        # Here, we store them in a way the formatter can use
-                        rate=str(emp_record.hourly_rate.quantize(Decimal("0.01"))),
-                        payout=str(payout.quantize(Decimal("0.01"))),
-                    )
-                )
-                current_dept_total_hours += emp_record.hours_worked
-                current_dept_total_payout += payout
-
-            dept_summary["total_hours"] = current_dept_total_hours
-
-            dept_summary["total_payout"] = str(
-                current_dept_total_payout.quantize(Decimal("0.01"))
+            employees.sort(key=_BY_NAME)
+            processed_report[dept_name] = DepartmentPayoutSummary(
+                employees=employees,
+                total_hours=total_hours,
+                total_payout=total_payout,
+                longest_name=longest_name,
+                max_rate=max_rate,
             )
 
-            processed_report[dept_name] = dept_summary
-
-        sorted_processed_report = dict(sorted(processed_report.items()))
-
-        return sorted_processed_report
+        return processed_report
 
 
 class PayoutConsoleFormatter(ReportFormatterStrategy[PayoutReportData]):
@@ -101,28 +102,34 @@ class PayoutConsoleFormatter(ReportFormatterStrategy[PayoutReportData]):
 
     def _get_column_widths(self, report_data: PayoutReportData) -> Dict[str, int]:
         """Calculates maximum widths for each column for alignment."""
-        # Add fixed prefix to names for width calculation
-        name_prefix = "---------------- "
+        # Widths come from the per-department maxima tracked by the generator,
+        # so only departments, not employees, are visited here.
         max_name_len = len("Name")  # Header
         max_hours_len = len("Hours")
         max_rate_len = len("Rate")
         max_payout_len = len("Payout")
 
         for dept_summary in report_data.values():
-            for emp in dept_summary["employees"]:
-                max_name_len = max(max_name_len, len(name_prefix + emp["name"]))
-                max_hours_len = max(max_hours_len, len(str(emp["hours"])))
-                max_rate_len = max(max_rate_len, len(str(emp["rate"])))
-                # Add 1 for '$' and potentially commas for larger numbers if needed
-                max_payout_len = max(max_payout_len, len(f"${emp['payout']}"))
-
+            longest_name = dept_summary.get("longest_name")
+            max_rate = dept_summary.get("max_rate")
+            if longest_name is None or max_rate is None:
+                # Summaries not built by PayoutReportGenerator lack the hints
+                employees = dept_summary["employees"]
+                longest_name = max((len(emp.name) for emp in employees), default=0)
+                max_rate = max((emp.rate for emp in employees), default=0)
+
+            max_name_len = max(max_name_len, len(_NAME_PREFIX) + longest_name)
+            max_rate_len = max(max_rate_len, len(_format_cents(max_rate)))
+            # Hours and payouts are non-negative, so the totals are at least as
+            # wide as any employee's values and determine those columns.
             max_hours_len = max(max_hours_len, len(str(dept_summary["total_hours"])))
+            # Add 1 for '$' and potentially commas for larger numbers if needed
             max_payout_len = max(
-                max_payout_len, len(f"${dept_summary['total_payout']}")
+                max_payout_len, len(f"${_format_cents(dept_summary['total_payout'])}")
             )
 
         # Ensure minimum width for headers if data is very narrow
-        max_name_len = max(max_name_len, len(name_prefix + "Employee Name Sample"))
+        max_name_len = max(max_name_len, len(_NAME_PREFIX + "Employee Name Sample"))
         max_hours_len = max(max_hours_len, 5)  # "Hours"
         max_rate_len = max(max_rate_len, 5)  # "Rate"
         max_payout_len = max(max_payout_len, 8)  # "$Payout"
@@ -147,39 +154,38 @@ class PayoutConsoleFormatter(ReportFormatterStrategy[PayoutReportData]):
         if not report_data:
             return "No data available to generate the report."
 
-        output_lines: List[str] = []
         widths = self._get_column_widths(report_data)
-        name_w, hours_w, rate_w, payout_w = (
-            widths["name"],
-            widths["hours"],
-            widths["rate"],
-            widths["payout"],
-        )
-
-        name_prefix = "---------------- "
+        # Build the row template once instead of re-parsing widths per line
+        row_format = (
+            f"{{:<{widths['name']}}} "
+            f"{{:>{widths['hours']}}} "
+            f"{{:>{widths['rate']}}} "
+            f"{{:>{widths['payout']}}}"
+        ).format
 
+        output_lines: List[str] = []
         for dept_name, dept_summary in report_data.items():
-            output_lines.append(f"\n{dept_name}")  # Department name
+            if output_lines:
+                output_lines.append("")  # Blank line between departments
+            output_lines.append(dept_name)
             for emp in dept_summary["employees"]:
-                payout_str = f"${Decimal(emp['payout']):.0f}"
-                rate_str = f"{Decimal(emp['rate']):.0f}"
-
-                # Add prefix to name for display
-                display_name = name_prefix + emp["name"]
                 output_lines.append(
-                    f"{display_name:<{name_w}} "
-                    f"{emp['hours']:>{hours_w}} "
-                    f"{rate_str:>{rate_w}} "
-                    f"{payout_str:>{payout_w}}"
+                    row_format(
+                        _NAME_PREFIX + emp.name,
+                        emp.hours,
+                        _round_cents(emp.rate),
+                        f"${_round_cents(emp.payout)}",
+                    )
                 )
 
-            # Department totals
-            total_payout_str = f"${Decimal(dept_summary['total_payout']):.0f}"
+            # Department totals, with empty name and rate columns
             output_lines.append(
-                f"{'':<{name_w}} "  # Empty name column for total
-                f"{dept_summary['total_hours']:>{hours_w}} "
-                f"{'':>{rate_w}} "  # Empty rate column for total
-                f"{total_payout_str:>{payout_w}}"
+                row_format(
+                    "",
+                    dept_summary["total_hours"],
+                    "",
+                    f"${_round_cents(dept_summary['total_payout'])}",
+                )
             )
 
-        return "\n".join(output_lines).strip()
+        return "\n".join(output_lines)
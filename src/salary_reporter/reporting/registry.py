@@ -1,16 +1,13 @@
 """Registry for report generators and formatters."""
 
-from typing import Dict, List, Type
+import importlib
+from typing import Dict, List, Tuple, Type
 
 from salary_reporter.exceptions import UnsupportedReportTypeError
 from salary_reporter.reporting.base import (
     ReportFormatterStrategy,
     ReportGeneratorStrategy,
 )
-from salary_reporter.reporting.payout_report import (
-    PayoutConsoleFormatter,
-    PayoutReportGenerator,
-)
 
 
 class ReportConfiguration:
@@ -32,21 +29,73 @@ class ReportConfiguration:
         self.formatter_cls = formatter_cls
 
 
-_REPORT_REGISTRY: Dict[str, ReportConfiguration] = {
-    "payout": ReportConfiguration(PayoutReportGenerator, PayoutConsoleFormatter),
+# Classes are referenced as "module:ClassName" strings and only imported when
+# the report is requested, which keeps CLI startup (e.g. --help) cheap.
+_REPORT_REGISTRY: Dict[str, Tuple[str, str]] = {
+    "payout": (
+        "salary_reporter.reporting.payout_report:PayoutReportGenerator",
+        "salary_reporter.reporting.payout_report:PayoutConsoleFormatter",
+    ),
     # New report types can be added here
-    # "average_rate":
-    #       ReportConfiguration(
-    #         AverageRateGenerator,
-    #         AverageRateConsoleFormatter
-    #       ),
+    # "average_rate": (
+    #     "salary_reporter.reporting.average_rate_report:AverageRateGenerator",
+    #     "salary_reporter.reporting.average_rate_report:AverageRateConsoleFormatter",
+    # ),
 }
 
+_RESOLVED_CONFIGURATIONS: Dict[str, ReportConfiguration] = {}
+
+
+def _import_class(class_path: str) -> type:
+    """
+    Imports a class from a "module:ClassName" path.
+
+    Only failures caused by the path itself are converted; an import error
+    raised from inside the report module (e.g. a missing dependency)
+    propagates unchanged.
+
+    Args:
+        class_path: The module path and class name separated by a colon.
+
+    Returns:
+        The imported class.
+
+    Raises:
+        UnsupportedReportTypeError: If the path is malformed, or its module or
+            class does not exist.
+    """
+    try:
+        module_path, class_name = class_path.split(":")
+    except ValueError as e:
+        raise UnsupportedReportTypeError(
+            f"Report class '{class_path}' is not a 'module:ClassName' path."
+        ) from e
+
+    try:
+        module = importlib.import_module(module_path)
+    except ModuleNotFoundError as e:
+        # Only the registered module (or a package above it) being missing
+        # means a bad entry; any other missing module is a real error.
+        if e.name is None or not f"{module_path}.".startswith(f"{e.name}."):
+            raise
+        raise UnsupportedReportTypeError(
+            f"Report class '{class_path}' could not be loaded: {e}"
+        ) from e
+
+    try:
+        return getattr(module, class_name)
+    except AttributeError as e:
+        raise UnsupportedReportTypeError(
+            f"Report class '{class_path}' could not be loaded: {e}"
+        ) from e
+
 
 def get_report_configuration(report_name: str) -> ReportConfiguration:
     """
     Retrieves the report generator and formatter classes for a given report name.
 
+    The classes are imported on first request and cached afterwards.
+
     Args:
         report_name: The name of the report type (e.g., "payout").
 
@@ -54,7 +103,8 @@ def get_report_configuration(report_name: str) -> ReportConfiguration:
         A ReportConfiguration object containing the generator and formatter classes.
 
     Raises:
-        UnsupportedReportTypeError: If the report_name is not registered.
+        UnsupportedReportTypeError: If the report_name is not registered or its
+            classes cannot be imported.
     """
     report_name_lower = report_name.lower()
     if report_name_lower not in _REPORT_REGISTRY:
@@ -62,7 +112,14 @@ def get_report_configuration(report_name: str) -> ReportConfiguration:
             f"Report type '{report_name}' is not supported. "
             f"Available types: {', '.join(_REPORT_REGISTRY.keys())}"
         )
-    return _REPORT_REGISTRY[report_name_lower]
+    report_config = _RESOLVED_CONFIGURATIONS.get(report_name_lower)
+    if report_config is None:
+        generator_path, formatter_path = _REPORT_REGISTRY[report_name_lower]
+        report_config = ReportConfiguration(
+            _import_class(generator_path), _import_class(formatter_path)
+        )
+        _RESOLVED_CONFIGURATIONS[report_name_lower] = report_config
+    return report_config
 
 
 def get_available_reports() -> List[str]:
@@ -1,26 +1,55 @@
 """Pytest fixtures and configuration."""
 
-from decimal import Decimal
 from pathlib import Path
-from typing import Callable, List
+from typing import Callable, Iterable, List, Tuple
 
 import pytest
 
 from salary_reporter.domain_models import EmployeeData
 
+EmployeeRow = Tuple[str, str, str, str, int, int]
+MakeEmployees = Callable[[Iterable[EmployeeRow]], List[EmployeeData]]
 
-@pytest.fixture()
-def sample_employee_data_list() -> List[EmployeeData]:
-    """Provides a sample list of EmployeeData objects."""
-    return [
-        EmployeeData(
-            "1", "alice@example.com", "Alice Johnson", "Marketing", 160, Decimal("50")
-        ),
-        EmployeeData("2", "bob@example.com", "Bob Smith", "Design", 150, Decimal("40")),
-        EmployeeData(
-            "3", "carol@example.com", "Carol Williams", "Design", 170, Decimal("60")
-        ),
-    ]
+
+@pytest.fixture(scope="session")
+def make_employees() -> MakeEmployees:
+    """
+    Factory fixture to build EmployeeData objects from plain row tuples.
+
+    Returns:
+        A function that takes an iterable of field tuples, in EmployeeData
+        field order, and returns the corresponding list of EmployeeData.
+    """
+
+    def _make_employees(rows: Iterable[EmployeeRow]) -> List[EmployeeData]:
+        """
+        Builds an EmployeeData object for every row.
+
+        Args:
+            rows: Tuples of (id, email, name, department, hours, rate in cents).
+
+        Returns:
+            A list of EmployeeData objects in the same order as the rows.
+        """
+        return list(map(EmployeeData._make, rows))
+
+    return _make_employees
+
+
+@pytest.fixture(scope="session")
+def sample_employee_data_list(
+    make_employees: MakeEmployees,
+) -> Tuple[EmployeeData, ...]:
+    """Provides a read-only sample of EmployeeData objects shared by all tests."""
+    return tuple(
+        make_employees(
+            [
+                ("1", "alice@example.com", "Alice Johnson", "Marketing", 160, 5000),
+                ("2", "bob@example.com", "Bob Smith", "Design", 150, 4000),
+                ("3", "carol@example.com", "Carol Williams", "Design", 170, 6000),
+            ]
+        )
+    )
 
 
 @pytest.fixture()
@@ -1,60 +1,126 @@
 """Tests for the command-line interface."""
 
-from typing import List
+import argparse
+import contextlib
+import io
+import os
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List, Optional, Tuple
 from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
 
-from salary_reporter import cli
+from salary_reporter import cli, data_loader
 from salary_reporter.domain_models import EmployeeData
 from salary_reporter.exceptions import SalaryReporterError
 
 
-def test_parse_arguments_basic() -> None:
-    """Test basic argument parsing."""
-    args = cli.parse_arguments(["file1.csv", "file2.csv", "--report", "payout"])
-    assert args.csv_files == ["file1.csv", "file2.csv"]
-    assert args.report == "payout"
-
-
-def test_parse_arguments_default_report() -> None:
-    """Test default report type."""
-    args = cli.parse_arguments(["file.csv"])
-    assert args.report == "payout"
-
+@pytest.fixture()
+def patched_cli(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """
+    Replaces the data loader and report lookup used by main_logic with mocks.
+
+    Returns:
+        A namespace with the mock loader instance (`loader`) and the mock
+        `get_report_configuration` function (`get_config`).
+    """
+    loader = MagicMock()
+    get_config = MagicMock()
+    # main_logic imports CSVDataLoader from data_loader at call time
+    monkeypatch.setattr(data_loader, "CSVDataLoader", lambda: loader)
+    monkeypatch.setattr(cli, "get_report_configuration", get_config)
+    return SimpleNamespace(loader=loader, get_config=get_config)
+
+
+@pytest.fixture()
+def args_ns() -> mock.Mock:
+    """Fixture for parsed CLI arguments requesting a payout report of one file."""
+    ns = mock.Mock(spec=cli.argparse.Namespace)
+    ns.csv_files = ["f.csv"]
+    ns.report = "payout"
+    return ns
+
+
+@pytest.fixture(scope="session")
+def parser() -> argparse.ArgumentParser:
+    """Fixture for the CLI argument parser, built once per test session."""
+    return cli._build_parser()
+
+
+@pytest.mark.parametrize(
+    ("argv", "csv_files", "report", "exit_code", "err_substr"),
+    [
+        pytest.param(
+            ["file1.csv", "file2.csv", "--report", "payout"],
+            ["file1.csv", "file2.csv"],
+            "payout",
+            None,
+            None,
+            id="basic",
+        ),
+        pytest.param(
+            ["file.csv"], ["file.csv"], "payout", None, None, id="default_report"
+        ),
+        pytest.param(
+            ["file.csv", "--report", "invalid_report_type"],
+            None,
+            None,
+            2,  # Argparse exits with code 2 for argument errors
+            "invalid choice: 'invalid_report_type'",
+            id="invalid_report",
+        ),
+        pytest.param(
+            ["--report", "payout"],
+            None,
+            None,
+            2,
+            "the following arguments are required: FILE",
+            id="missing_files",
+        ),
+    ],
+)
+def test_parse_arguments(
+    argv: List[str],
+    csv_files: Optional[List[str]],
+    report: Optional[str],
+    exit_code: Optional[int],
+    err_substr: Optional[str],
+    parser: argparse.ArgumentParser,
+) -> None:
+    """Test argument parsing for valid and invalid command lines."""
+    if exit_code is None:
+        args = cli.parse_arguments(argv, parser)
+        assert args.csv_files == csv_files
+        assert args.report == report
+        return
 
-def test_parse_arguments_invalid_report(capsys: pytest.CaptureFixture) -> None:
-    """Test invalid report type choice."""
-    with pytest.raises(SystemExit) as excinfo:  # argparse exits on error
-        cli.parse_arguments(["file.csv", "--report", "invalid_report_type"])
-    # Argparse exits with code 2 for argument errors
-    assert excinfo.value.code == 2
     # Check stderr for error message (argparse prints to stderr)
-    captured = capsys.readouterr()
-    assert "invalid choice: 'invalid_report_type'" in captured.err
+    stderr = io.StringIO()
+    with contextlib.redirect_stderr(stderr), pytest.raises(SystemExit) as excinfo:
+        cli.parse_arguments(argv, parser)  # argparse exits on error
+    assert excinfo.value.code == exit_code
+    assert err_substr in stderr.getvalue()
 
 
-def test_parse_arguments_missing_files(capsys: pytest.CaptureFixture) -> None:
-    """Test missing required file arguments."""
-    with pytest.raises(SystemExit) as excinfo:
-        cli.parse_arguments(["--report", "payout"])
-    assert excinfo.value.code == 2
-    captured = capsys.readouterr()
-    assert "the following arguments are required: FILE" in captured.err
+def test_parse_arguments_default_parser() -> None:
+    """Test that the shared CLI parser is used when none is given."""
+    args = cli.parse_arguments(["file.csv"])
+    assert args.csv_files == ["file.csv"]
+    assert cli._build_parser() is cli._build_parser()  # Built only once
 
 
-@mock.patch("salary_reporter.cli.CSVDataLoader")
-@mock.patch("salary_reporter.cli.get_report_configuration")
 def test_main_logic_success(
-    mock_get_config: MagicMock,
-    mock_data_loader_cls: MagicMock,
-    sample_employee_data_list: List[EmployeeData],
+    patched_cli: SimpleNamespace,
+    args_ns: mock.Mock,
+    sample_employee_data_list: Tuple[EmployeeData, ...],
 ) -> None:
     """Test successful execution of main_logic."""
     # Mock instances and their methods
-    mock_loader_instance = mock_data_loader_cls.return_value
-    mock_loader_instance.load_all_data.return_value = sample_employee_data_list
+    patched_cli.loader.load_all_data.return_value = sample_employee_data_list
 
     mock_generator_cls = mock.MagicMock()
     mock_formatter_cls = mock.MagicMock()
@@ -65,103 +131,112 @@ def test_main_logic_success(
     mock_report_config_obj = mock.Mock()
     mock_report_config_obj.generator_cls = mock_generator_cls
     mock_report_config_obj.formatter_cls = mock_formatter_cls
-    mock_get_config.return_value = mock_report_config_obj
+    patched_cli.get_config.return_value = mock_report_config_obj
 
     mock_generator_instance.generate.return_value = {"some": "raw_data"}
     mock_formatter_instance.format.return_value = "Formatted Report"
 
-    args_namespace = mock.Mock(spec=cli.argparse.Namespace)
-    args_namespace.csv_files = ["file1.csv"]
-    args_namespace.report = "payout"
-
-    result = cli.main_logic(args_namespace)
+    result = cli.main_logic(args_ns)
 
-    mock_loader_instance.load_all_data.assert_called_once_with(["file1.csv"])
-    mock_get_config.assert_called_once_with("payout")
+    patched_cli.loader.load_all_data.assert_called_once_with(["f.csv"])
+    patched_cli.get_config.assert_called_once_with("payout")
     mock_generator_instance.generate.assert_called_once_with(sample_employee_data_list)
     mock_formatter_instance.format.assert_called_once_with({"some": "raw_data"})
     assert result == "Formatted Report"
 
 
-@mock.patch("salary_reporter.cli.CSVDataLoader")
-def test_main_logic_no_data(mock_data_loader_cls: MagicMock) -> None:
+def test_main_logic_no_data(patched_cli: SimpleNamespace, args_ns: mock.Mock) -> None:
     """Test main_logic when no employee data is found."""
-    mock_loader_instance = mock_data_loader_cls.return_value
-    mock_loader_instance.load_all_data.return_value = []
+    patched_cli.loader.load_all_data.return_value = []
 
-    args_namespace = mock.Mock(spec=cli.argparse.Namespace)
-    args_namespace.csv_files = ["empty.csv"]
-    args_namespace.report = "payout"
+    args_ns.csv_files = ["empty.csv"]
 
-    result = cli.main_logic(args_namespace)
+    result = cli.main_logic(args_ns)
     assert result == "No employee data found in the provided files."
+    patched_cli.get_config.assert_not_called()
 
 
-@mock.patch("salary_reporter.cli.parse_arguments")
-@mock.patch("salary_reporter.cli.main_logic")
-def test_run_success(
-    mock_main_logic: MagicMock,
-        mock_parse_args: MagicMock,
-        capsys: pytest.CaptureFixture
-) -> None:
+def test_run_success(args_ns: mock.Mock, monkeypatch: pytest.MonkeyPatch) -> None:
     """Test successful run of the CLI entry point."""
-    args_namespace = mock.Mock(spec=cli.argparse.Namespace)
-    args_namespace.csv_files = ["f.csv"]
-    args_namespace.report = "payout"
-    mock_parse_args.return_value = args_namespace
-    mock_main_logic.return_value = "Test Report Output"
+    mock_parse_args = MagicMock(return_value=args_ns)
+    mock_main_logic = MagicMock(return_value="Test Report Output")
+    monkeypatch.setattr(cli, "parse_arguments", mock_parse_args)
+    monkeypatch.setattr(cli, "main_logic", mock_main_logic)
+    printed: List[str] = []
+    # Shadow the builtin in the cli module only, so pytest's own output is
+    # left alone.
+    monkeypatch.setattr(
+        cli,
+        "print",
+        lambda *args, **_kwargs: printed.append(" ".join(map(str, args))),
+        raising=False,
+    )
 
     cli.run()
 
-    captured = capsys.readouterr()
-    assert "Test Report Output" in captured.out
-    mock_main_logic.assert_called_once_with(args_namespace)
-    mock_parse_args.assert_called_once()
-
-
-@mock.patch("salary_reporter.cli.parse_arguments")
-@mock.patch(
-    "salary_reporter.cli.main_logic",
-    side_effect=SalaryReporterError("Test Error")
-)
-def test_run_salary_reporter_error(
-        mock_main_logic: MagicMock,
-        mock_parse_args: MagicMock,
-        capsys: pytest.CaptureFixture
-) -> None:
-    """Test CLI run with a known SalaryReporterError."""
-    args_namespace = mock.Mock(spec=cli.argparse.Namespace)
-    mock_parse_args.return_value = args_namespace
-
-    with pytest.raises(SystemExit) as excinfo:
-        cli.run()
-    assert excinfo.value.code == 1
-    captured = capsys.readouterr()
-    assert "Error: Test Error" in captured.err
-
+    assert printed == ["Test Report Output"]
+    mock_main_logic.assert_called_once_with(args_ns)
     mock_parse_args.assert_called_once()
-    mock_main_logic.assert_called_once_with(args_namespace)
 
 
-@mock.patch("salary_reporter.cli.parse_arguments")
-@mock.patch(
-    "salary_reporter.cli.main_logic", side_effect=Exception("Unexpected Kaboom")
+@pytest.mark.parametrize(
+    ("exc", "code", "msg"),
+    [
+        pytest.param(
+            SalaryReporterError("Test Error"),
+            1,
+            "Error: Test Error",
+            id="salary_reporter_error",
+        ),
+        pytest.param(
+            Exception("Unexpected Kaboom"),
+            2,
+            "An unexpected error occurred: Unexpected Kaboom",
+            id="unexpected_error",
+        ),
+    ],
 )
-def test_run_unexpected_error(
-        mock_main_logic: MagicMock,
-        mock_parse_args: MagicMock,
-        capsys: pytest.CaptureFixture
+def test_run_error(
+    exc: Exception,
+    code: int,
+    msg: str,
+    args_ns: mock.Mock,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
 ) -> None:
-    """Test CLI run with an unexpected generic exception."""
-    args_namespace = mock.Mock(spec=cli.argparse.Namespace)
-    mock_parse_args.return_value = args_namespace
+    """Test that run() reports errors on stderr and exits with the right code."""
+    mock_parse_args = MagicMock(return_value=args_ns)
+    mock_main_logic = MagicMock(side_effect=exc)
+    monkeypatch.setattr(cli, "parse_arguments", mock_parse_args)
+    monkeypatch.setattr(cli, "main_logic", mock_main_logic)
 
     with pytest.raises(SystemExit) as excinfo:
         cli.run()
-    assert excinfo.value.code == 2
+    assert excinfo.value.code == code
     captured = capsys.readouterr()
-    assert "An unexpected error occurred: Unexpected Kaboom" in captured.err
-    mock_parse_args.assert_called_once()
+    assert msg in captured.err
 
     mock_parse_args.assert_called_once()
-    mock_main_logic.assert_called_once_with(args_namespace)
+    mock_main_logic.assert_called_once_with(args_ns)
+
+
+def test_import_cli_defers_heavy_modules() -> None:
+    """Test that importing the CLI does not load the loader or report modules."""
+    deferred = (
+        "salary_reporter.data_loader",
+        "salary_reporter.reporting.payout_report",
+    )
+    code = (
+        "import sys, salary_reporter.cli; "
+        f"print([name for name in {deferred!r} if name in sys.modules])"
+    )
+    # A fresh interpreter, as this test session has already imported them.
+    src_dir = str(Path(cli.__file__).resolve().parents[1])
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env={**os.environ, "PYTHONPATH": src_dir},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
@@ -1,13 +1,13 @@
 """Tests for the CSVDataLoader."""
 
-from decimal import Decimal
+import csv
+import io
 from pathlib import Path
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
 import pytest
 
-from salary_reporter.data_loader import CSVDataLoader
-from salary_reporter.domain_models import EmployeeData
+from salary_reporter.data_loader import CSVDataLoader, _parse_cents
 from salary_reporter.exceptions import (
     DataLoaderError,
     DataParsingError,
@@ -15,17 +15,21 @@ from salary_reporter.exceptions import (
     MissingHeaderError,
 )
 
+if TYPE_CHECKING:
+    from conftest import MakeEmployees
+
 TempCsvFileFixture = Callable[[str, str], Path]
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def loader() -> CSVDataLoader:
-    """Fixture for CSVDataLoader instance."""
+    """Fixture for CSVDataLoader instance, shared as the loader is stateless."""
     return CSVDataLoader()
 
 
 def test_load_normal_csv(
-    loader: CSVDataLoader, temp_csv_file: TempCsvFileFixture
+    loader: CSVDataLoader,
+    make_employees: "MakeEmployees",
 ) -> None:
     """Test loading a standard CSV file."""
     content = (
@@ -33,150 +37,120 @@ def test_load_normal_csv(
         "1,alice@example.com,Alice Johnson,Marketing,160,50\n"
         "2,bob@example.com,Bob Smith,Design,150,40"
     )
-    file_path = temp_csv_file(content, "normal.csv")
-    data = loader.load_data_from_file(str(file_path))
+    data = loader.load_data_from_stream(io.StringIO(content), "normal.csv")
 
-    assert len(data) == 2
-    assert data[0] == EmployeeData(
-        "1", "alice@example.com", "Alice Johnson", "Marketing", 160, Decimal("50")
-    )
-    assert data[1] == EmployeeData(
-        "2", "bob@example.com", "Bob Smith", "Design", 150, Decimal("40")
+    assert data == make_employees(
+        [
+            ("1", "alice@example.com", "Alice Johnson", "Marketing", 160, 5000),
+            ("2", "bob@example.com", "Bob Smith", "Design", 150, 4000),
+        ]
     )
 
 
-def test_load_csv_with_rate_column(
-    loader: CSVDataLoader, temp_csv_file: TempCsvFileFixture
+@pytest.mark.parametrize(
+    ("hours_column", "rate_column"),
+    [
+        ("hours_worked", "hourly_rate"),
+        ("hours_worked", "rate"),
+        ("hours", "salary"),
+    ],
+)
+def test_load_csv_with_column_variants(
+    loader: CSVDataLoader, hours_column: str, rate_column: str
 ) -> None:
-    """Test loading CSV with 'rate' as hourly rate column."""
+    """Test loading CSV with alternative hours and hourly rate column names."""
     content = (
-        "id,name,department,hours_worked,rate,email\n"
+        f"id,name,department,{hours_column},{rate_column},email\n"
         "1,Dave Davis,Sales,100,55,dave@example.com"
     )
-    file_path = temp_csv_file(content, "rate_col.csv")
-    data = loader.load_data_from_file(str(file_path))
+    data = loader.load_data_from_stream(io.StringIO(content), "variant_col.csv")
     assert len(data) == 1
-    assert data[0].hourly_rate == Decimal("55")
+    assert data[0].hourly_rate == 5500
+    assert data[0].hours_worked == 100
     assert data[0].name == "Dave Davis"  # Check other fields map correctly
 
 
-def test_load_csv_with_salary_column(
-    loader: CSVDataLoader, temp_csv_file: TempCsvFileFixture
-) -> None:
-    """Test loading CSV with 'salary' as hourly rate column."""
-    content = (
-        "id,name,department,hours,salary,email\n"
-        "1,Eve Evans,HR,120,45,eve@example.com"
-    )  # 'hours' also a variant
-    file_path = temp_csv_file(content, "salary_col.csv")
-    data = loader.load_data_from_file(str(file_path))
-    assert len(data) == 1
-    assert data[0].hourly_rate == Decimal("45")
-    assert data[0].hours_worked == 120
-
-
-def test_load_empty_file(
-    loader: CSVDataLoader, temp_csv_file: TempCsvFileFixture
-) -> None:
+def test_load_empty_file(loader: CSVDataLoader) -> None:
     """Test loading an empty file."""
-    file_path = temp_csv_file("", "empty.csv")
     with pytest.raises(MissingHeaderError, match="empty or has no header"):
-        loader.load_data_from_file(str(file_path))
+        loader.load_data_from_stream(io.StringIO(""), "empty.csv")
 
 
-def test_load_file_only_header(
-    loader: CSVDataLoader, temp_csv_file: TempCsvFileFixture
-) -> None:
+def test_load_file_only_header(loader: CSVDataLoader) -> None:
     """Test loading a file with only a header row."""
     content = "id,name,department,hours_worked,hourly_rate,email"
-    file_path = temp_csv_file(content, "header_only.csv")
-    data = loader.load_data_from_file(str(file_path))
+    data = loader.load_data_from_stream(io.StringIO(content), "header_only.csv")
     assert len(data) == 0
 
 
-def test_load_missing_required_column(
-    loader: CSVDataLoader, temp_csv_file: TempCsvFileFixture
-) -> None:
+def test_load_missing_required_column(loader: CSVDataLoader) -> None:
     """Test loading CSV missing a critical column (e.g., name)."""
-    content = "id,department,hours_worked,hourly_rate\n" "1,Tech,100,20"
-    file_path = temp_csv_file(content, "missing_col.csv")
-    with pytest.raises(
-        MissingColumnError, match="Required column for 'email'"
-    ):  # or 'name'
-        loader.load_data_from_file(str(file_path))
+    content = "id,department,hours_worked,hourly_rate\n1,Tech,100,20"
+    # email is the first required column missing (name is missing too)
+    with pytest.raises(MissingColumnError, match="Required column for 'email'"):
+        loader.load_data_from_stream(io.StringIO(content), "missing_col.csv")
 
 
-def test_load_no_valid_rate_column(
-    loader: CSVDataLoader, temp_csv_file: TempCsvFileFixture
-) -> None:
+def test_load_no_valid_rate_column(loader: CSVDataLoader) -> None:
     """Test loading CSV without any recognizable hourly rate column."""
     content = "id,name,department,hours_worked,wage,email"  # Added email
-    file_path = temp_csv_file(content, "no_rate_col.csv")
     with pytest.raises(MissingColumnError, match="Required column for 'hourly_rate'"):
-        loader.load_data_from_file(str(file_path))
-
-
-def test_load_malformed_data_non_numeric(
-    loader: CSVDataLoader, temp_csv_file: TempCsvFileFixture
-) -> None:
-    """Test CSV with non-numeric data where numbers are expected."""
-    content_hours = (
-        "id,name,department,hours_worked,hourly_rate,email\n"
-        "1,Bad Data,Test,one hundred,50,bad@example.com"
-    )
-    file_path_hours = temp_csv_file(content_hours, "malformed_hours.csv")
-
-    with pytest.raises(
-        DataParsingError, match=r"Error parsing data.*invalid literal for int\(\) with base 10: 'one hundred'"
-    ):
-        loader.load_data_from_file(str(file_path_hours))
-
-    content_rate = (
-        "id,name,department,hours_worked,hourly_rate,email\n"
-        "2,Bad Rate,Test,100,fifty,badrate@example.com"
-    )
-    file_path_rate = temp_csv_file(content_rate, "malformed_rate.csv")
-
-    with pytest.raises(
-        DataParsingError, match=r"Error parsing data.*\[<class 'decimal.ConversionSyntax'>\]"
-    ):
-        loader.load_data_from_file(str(file_path_rate))
-
-
-def test_load_negative_values(
-    loader: CSVDataLoader, temp_csv_file: TempCsvFileFixture
+        loader.load_data_from_stream(io.StringIO(content), "no_rate_col.csv")
+
+
+@pytest.mark.parametrize(
+    ("hours", "rate", "match"),
+    [
+        pytest.param(
+            "one hundred",
+            "50",
+            r"invalid literal for int\(\) with base 10: 'one hundred'",
+            id="non_numeric_hours",
+        ),
+        pytest.param(
+            "100", "fifty", "invalid monetary amount: 'fifty'", id="non_numeric_rate"
+        ),
+        pytest.param(
+            "100",
+            "50.255",
+            "monetary amount '50.255' has more than two decimal places",
+            id="sub_cent_rate",
+        ),
+        pytest.param(
+            "-10",
+            "50",
+            "Hours worked and hourly rate cannot be negative",
+            id="negative_hours",
+        ),
+        pytest.param(
+            "100",
+            "-50",
+            "Hours worked and hourly rate cannot be negative",
+            id="negative_rate",
+        ),
+    ],
+)
+def test_load_invalid_rows(
+    loader: CSVDataLoader, hours: str, rate: str, match: str
 ) -> None:
-    """Test CSV with negative hours or rate."""
+    """Test CSV rows with invalid hours or hourly rate values."""
     content = (
         "id,name,department,hours_worked,hourly_rate,email\n"
-        "1,Neg Hours,Test,-10,50,neg@example.com"
-    )
-    file_path = temp_csv_file(content, "neg_hours.csv")
-    with pytest.raises(
-        DataParsingError, match="Hours worked and hourly rate cannot be negative"
-    ):
-        loader.load_data_from_file(str(file_path))
-
-    content_rate = (
-        "id,name,department,hours_worked,hourly_rate,email\n"
-        "2,Neg Rate,Test,100,-50,negrate@example.com"
+        f"1,Bad Data,Test,{hours},{rate},bad@example.com"
     )
-    file_path_rate = temp_csv_file(content_rate, "neg_rate.csv")
-    with pytest.raises(
-        DataParsingError, match="Hours worked and hourly rate cannot be negative"
-    ):
-        loader.load_data_from_file(str(file_path_rate))
+    with pytest.raises(DataParsingError, match=f"Error parsing data.*{match}"):
+        loader.load_data_from_stream(io.StringIO(content), "invalid.csv")
 
 
 def test_load_all_data_multiple_files(
     loader: CSVDataLoader, temp_csv_file: TempCsvFileFixture
 ) -> None:
     """Test loading data from multiple CSV files."""
-    content1 = \
+    content1 = (
         "id,name,department,hours_worked,hourly_rate,email\n1,Alice,Dev,10,1,a@e.c"
+    )
 
-    content2 = \
-        "id,name,department,hours,rate,email\n2,Bob,QA,20,2,b@e.c"
+    content2 = "id,name,department,hours,rate,email\n2,Bob,QA,20,2,b@e.c"
 
     file1 = temp_csv_file(content1, "file1.csv")
     file2 = temp_csv_file(content2, "file2.csv")
@@ -185,8 +159,56 @@ def test_load_all_data_multiple_files(
     assert len(all_data) == 2
     assert all_data[0].name == "Alice"
     assert all_data[1].name == "Bob"
-    assert all_data[0].hourly_rate == Decimal("1")
-    assert all_data[1].hourly_rate == Decimal("2")
+    assert all_data[0].hourly_rate == 100
+    assert all_data[1].hourly_rate == 200
+
+
+def test_load_rate_with_cents(loader: CSVDataLoader) -> None:
+    """Test that fractional hourly rates are parsed into exact cents."""
+    content = (
+        "id,email,name,department,hours_worked,hourly_rate\n"
+        "1,alice@example.com,Alice Johnson,Marketing,160,50.25\n"
+        "2,bob@example.com,Bob Smith,Design,150,40.5"
+    )
+    data = loader.load_data_from_stream(io.StringIO(content), "cents.csv")
+    assert data[0].hourly_rate == 5025
+    assert data[1].hourly_rate == 4050
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        pytest.param("50", 5000, id="whole"),
+        pytest.param("+5", 500, id="explicit_plus"),
+        pytest.param("-5", -500, id="negative"),
+        pytest.param(".5", 50, id="no_whole_part"),
+        pytest.param("5.", 500, id="trailing_point"),
+        pytest.param("0.05", 5, id="leading_zero_fraction"),
+        pytest.param("50.250", 5025, id="trailing_zero_past_cents"),
+        pytest.param("40.000", 4000, id="zero_fraction_past_cents"),
+        pytest.param("5e1", 5000, id="exponent"),
+        pytest.param("1.5E-1", 15, id="negative_exponent"),
+    ],
+)
+def test_parse_cents(value: str, expected: int) -> None:
+    """Test that _parse_cents accepts the same amounts as Decimal would."""
+    assert _parse_cents(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value", ["1.2.3", ".", "", "+", "abc", "5.-1", "NaN", "Infinity", "1e999999999"]
+)
+def test_parse_cents_invalid(value: str) -> None:
+    """Test that _parse_cents rejects values that are not amounts."""
+    with pytest.raises(ValueError, match="invalid monetary amount"):
+        _parse_cents(value)
+
+
+@pytest.mark.parametrize("value", ["50.255", "1.234", "0.001", "1e-3"])
+def test_parse_cents_sub_cent(value: str) -> None:
+    """Test that _parse_cents rejects non-zero digits past the cents."""
+    with pytest.raises(ValueError, match="more than two decimal places"):
+        _parse_cents(value)
 
 
 def test_file_not_found(loader: CSVDataLoader) -> None:
@@ -195,9 +217,7 @@ def test_file_not_found(loader: CSVDataLoader) -> None:
         loader.load_data_from_file("non_existent_file.csv")
 
 
-def test_skip_empty_lines(
-    loader: CSVDataLoader, temp_csv_file: TempCsvFileFixture
-) -> None:
+def test_skip_empty_lines(loader: CSVDataLoader) -> None:
     """Test that empty lines in data are skipped."""
     content = (
         "id,email,name,department,hours_worked,hourly_rate\n"
@@ -205,6 +225,30 @@ def test_skip_empty_lines(
         "\n"  # Empty line
         "2,bob@example.com,Bob Smith,Design,150,40\n"
     )
-    file_path = temp_csv_file(content, "empty_lines.csv")
-    data = loader.load_data_from_file(str(file_path))
+    data = loader.load_data_from_stream(io.StringIO(content), "empty_lines.csv")
     assert len(data) == 2
+
+
+def test_load_quoted_field_with_comma(loader: CSVDataLoader) -> None:
+    """Test that quoted fields may contain commas."""
+    content = (
+        "id,email,name,department,hours_worked,hourly_rate\n"
+        '1,alice@example.com,"Johnson, Alice",Marketing,160,50\n'
+    )
+    data = loader.load_data_from_stream(io.StringIO(content), "quoted.csv")
+    assert len(data) == 1
+    assert data[0].name == "Johnson, Alice"
+    assert data[0].department == "Marketing"
+
+
+def test_load_malformed_csv(loader: CSVDataLoader) -> None:
+    """Test that csv module errors surface as DataParsingError."""
+    oversized_name = "x" * (csv.field_size_limit() + 1)
+    content = (
+        "id,email,name,department,hours_worked,hourly_rate\n"
+        f"1,a@example.com,{oversized_name},Dev,10,20"
+    )
+    with pytest.raises(
+        DataParsingError, match=r"Malformed CSV at line 2 in 'huge\.csv'.*field"
+    ):
+        loader.load_data_from_stream(io.StringIO(content), "huge.csv")
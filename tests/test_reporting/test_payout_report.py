@@ -1,23 +1,63 @@
 """Tests for PayoutReportGenerator and PayoutConsoleFormatter."""
 
-from decimal import Decimal
+import re
+from typing import TYPE_CHECKING, Tuple
 
 import pytest
 
-from salary_reporter.custom_types import PayoutReportData
+from salary_reporter.custom_types import (
+    DepartmentPayoutSummary,
+    EmployeePayoutDetail,
+    PayoutReportData,
+)
 from salary_reporter.domain_models import EmployeeData
 from salary_reporter.reporting.payout_report import (
     PayoutConsoleFormatter,
     PayoutReportGenerator,
 )
 
+if TYPE_CHECKING:
+    from conftest import MakeEmployees
 
-@pytest.fixture()
+# Fragments expected in the formatted sample report. Total lines come first so
+# they take precedence over the bare numbers when scanning.
+STRUCTURE_PATTERN = re.compile(
+    r"\s+320\s+\$16200|\s+160\s+\$8000"
+    r"|---------------- (?:Bob Smith|Carol Williams|Alice Johnson)"
+    r"|Design|Marketing|\b150\b|\b40\b|\$6000"
+)
+
+# Small hand-built report used for exact output matching.
+SPECIFIC_DATA: PayoutReportData = {
+    "AlphaTeam": {
+        "employees": [
+            # Corrected order: "Aye Alpha" then "Zee Alpha"
+            EmployeePayoutDetail("Aye Alpha", 20, 200, 4000),
+            EmployeePayoutDetail("Zee Alpha", 10, 100, 1000),
+        ],
+        "total_hours": 30,
+        "total_payout": 5000,
+        "longest_name": 9,
+        "max_rate": 200,
+    }
+}
+
+
+@pytest.fixture(scope="module")
 def payout_generator() -> PayoutReportGenerator:
     """Fixture for PayoutReportGenerator."""
     return PayoutReportGenerator()
 
 
+@pytest.fixture(scope="module")
+def sample_report(
+    payout_generator: PayoutReportGenerator,
+    sample_employee_data_list: Tuple[EmployeeData, ...],
+) -> PayoutReportData:
+    """Fixture for the payout report generated from the sample employees."""
+    return payout_generator.generate(sample_employee_data_list)
+
+
 @pytest.fixture()
 def payout_formatter() -> PayoutConsoleFormatter:
     """Fixture for PayoutConsoleFormatter."""
@@ -32,30 +72,32 @@ def test_payout_report_generator_empty_data(payout_generator: PayoutReportGenera
 
 def test_payout_report_generator_single_employee(
     payout_generator: PayoutReportGenerator,
+    make_employees: "MakeEmployees",
 ):
     """Test PayoutReportGenerator with a single employee."""
-    emp_data = [
-        EmployeeData("1", "test@example.com", "John Doe", "Sales", 100, Decimal("20"))
-    ]
+    emp_data = make_employees(
+        [("1", "test@example.com", "John Doe", "Sales", 100, 2000)]
+    )
     report_data = payout_generator.generate(emp_data)
 
     assert "Sales" in report_data
     sales_dept = report_data["Sales"]
     assert len(sales_dept["employees"]) == 1
-    assert sales_dept["employees"][0]["name"] == "John Doe"
-    assert sales_dept["employees"][0]["hours"] == 100
-    assert sales_dept["employees"][0]["rate"] == "20.00"
-    assert sales_dept["employees"][0]["payout"] == "2000.00"
+    assert sales_dept["employees"][0].name == "John Doe"
+    assert sales_dept["employees"][0].hours == 100
+    assert sales_dept["employees"][0].rate == 2000
+    assert sales_dept["employees"][0].payout == 200000
     assert sales_dept["total_hours"] == 100
-    assert sales_dept["total_payout"] == "2000.00"
+    assert sales_dept["total_payout"] == 200000
+    assert sales_dept["longest_name"] == len("John Doe")
+    assert sales_dept["max_rate"] == 2000
 
 
 def test_payout_report_generator_multiple_employees_departments(
-    payout_generator: PayoutReportGenerator,
-    sample_employee_data_list: list[EmployeeData],
+    sample_report: PayoutReportData,
 ):
     """Test PayoutReportGenerator with multiple employees and departments."""
-    report_data = payout_generator.generate(sample_employee_data_list)
+    report_data = sample_report
 
     assert len(report_data) == 2  # Design, Marketing
     assert "Design" in report_data
@@ -65,27 +107,23 @@ def test_payout_report_generator_multiple_employees_departments(
     marketing_dept = report_data["Marketing"]
 
     assert len(design_dept["employees"]) == 2
-    assert design_dept["employees"][0]["name"] == "Bob Smith"  # Sorted by name
-    assert design_dept["employees"][1]["name"] == "Carol Williams"
+    assert design_dept["employees"][0].name == "Bob Smith"  # Sorted by name
+    assert design_dept["employees"][1].name == "Carol Williams"
     assert design_dept["total_hours"] == 150 + 170
+    assert design_dept["longest_name"] == len("Carol Williams")
+    assert design_dept["max_rate"] == 6000
 
-    expected_design_payout = Decimal("150") * Decimal("40") + Decimal("170") * Decimal(
-        "60"
-    )
+    expected_design_payout = 150 * 4000 + 170 * 6000
 
-    assert design_dept["total_payout"] == str(
-        expected_design_payout.quantize(Decimal("0.01"))
-    )
+    assert design_dept["total_payout"] == expected_design_payout
 
     assert len(marketing_dept["employees"]) == 1
-    assert marketing_dept["employees"][0]["name"] == "Alice Johnson"
+    assert marketing_dept["employees"][0].name == "Alice Johnson"
     assert marketing_dept["total_hours"] == 160
 
-    expected_marketing_payout = Decimal("160") * Decimal("50")
+    expected_marketing_payout = 160 * 5000
 
-    assert marketing_dept["total_payout"] == str(
-        expected_marketing_payout.quantize(Decimal("0.01"))
-    )
+    assert marketing_dept["total_payout"] == expected_marketing_payout
 
 
 def test_payout_console_formatter_empty_data(payout_formatter: PayoutConsoleFormatter):
@@ -96,45 +134,34 @@ def test_payout_console_formatter_empty_data(payout_formatter: PayoutConsoleForm
 
 def test_payout_console_formatter_structure(
     payout_formatter: PayoutConsoleFormatter,
-    payout_generator: PayoutReportGenerator,
-    sample_employee_data_list: list[EmployeeData],
+    sample_report: PayoutReportData,
 ):
     """Test the structure of console output from PayoutConsoleFormatter."""
-    raw_data = payout_generator.generate(sample_employee_data_list)
-    formatted_output = payout_formatter.format(raw_data)
-
-    # Check for department names
-    assert "Design" in formatted_output
-    assert "Marketing" in formatted_output
-
-    # Check for employee names (Bob Smith is first in Design due to sorting)
-    assert "---------------- Bob Smith" in formatted_output
-    assert "---------------- Carol Williams" in formatted_output
-    assert "---------------- Alice Johnson" in formatted_output
-
-    # Check for some numbers (exact spacing depends on calculated widths)
-    # For Bob Smith: 150 hours, 40 rate, $6000 payout
-    assert "150" in formatted_output
-    assert "40" in formatted_output
-    assert "$6000" in formatted_output
-    # For Design total: 320 hours, $16200 payout
-    assert "320" in formatted_output
-    assert "$16200" in formatted_output
-
-    # Verify department sorting (Design before Marketing)
-    assert formatted_output.find("Design") < formatted_output.find("Marketing")
+    formatted_output = payout_formatter.format(sample_report)
 
-    # Check structure of total lines (e.g., blank name and rate for total)
-    # Example for Design total line: '320 $16200'
-    # This is tricky to assert precisely without knowing exact widths.
-    # We can check that a line with the total hours \
-    # and payout exists for each department.
-    design_total_line_regex = r"\s+320\s+\$16200"
-    marketing_total_line_regex = r"\s+160\s+\$8000"
-    import re
+    matches = {
+        " ".join(match.group(0).split())  # Collapse width-dependent spacing
+        for match in STRUCTURE_PATTERN.finditer(formatted_output)
+    }
+    assert {
+        # Department names
+        "Design",
+        "Marketing",
+        # Employee names (Bob Smith is first in Design due to sorting)
+        "---------------- Bob Smith",
+        "---------------- Carol Williams",
+        "---------------- Alice Johnson",
+        # For Bob Smith: 150 hours, 40 rate, $6000 payout
+        "150",
+        "40",
+        "$6000",
+        # Total lines have a blank name and rate column
+        "320 $16200",
+        "160 $8000",
+    } <= matches
 
-    assert re.search(design_total_line_regex, formatted_output) is not None
-    assert re.search(marketing_total_line_regex, formatted_output) is not None
+    # Verify department sorting (Design before Marketing)
+    assert formatted_output.index("Design") < formatted_output.index("Marketing")
 
 
 def test_payout_console_formatter_specific_output(
@@ -144,18 +171,7 @@ def test_payout_console_formatter_specific_output(
     Test console formatter with a specific,
     small dataset for exact output matching.
     """
-    specific_data: PayoutReportData = {
-        "AlphaTeam": {
-            "employees": [
-                # Corrected order: "Aye Alpha" then "Zee Alpha"
-                {"name": "Aye Alpha", "hours": 20, "rate": "2.00", "payout": "40.00"},
-                {"name": "Zee Alpha", "hours": 10, "rate": "1.00", "payout": "10.00"},
-            ],
-            "total_hours": 30,
-            "total_payout": "50.00",
-        }
-    }
-    output = payout_formatter.format(specific_data)
+    output = payout_formatter.format(SPECIFIC_DATA)
 
     # Department Header
     assert "AlphaTeam" in output
@@ -180,3 +196,62 @@ def test_payout_console_formatter_specific_output(
 
     # Check that Aye appears before Zee in the output
     assert output.find("Aye Alpha") < output.find("Zee Alpha")
+
+
+def test_payout_console_formatter_without_width_hints(
+    payout_generator: PayoutReportGenerator,
+    payout_formatter: PayoutConsoleFormatter,
+    make_employees: "MakeEmployees",
+) -> None:
+    """Test that summaries without the generator's width hints format the same."""
+    report_data = payout_generator.generate(
+        make_employees(
+            [
+                ("1", "b@e.c", "Bartholomew Featherstonehaugh", "Ops", 7, 1234567),
+                ("2", "c@e.c", "Cy", "Ops", 1, 100),
+            ]
+        )
+    )
+    without_hints: PayoutReportData = {
+        dept_name: DepartmentPayoutSummary(
+            employees=summary["employees"],
+            total_hours=summary["total_hours"],
+            total_payout=summary["total_payout"],
+        )
+        for dept_name, summary in report_data.items()
+    }
+
+    assert payout_formatter.format(without_hints) == payout_formatter.format(
+        report_data
+    )
+
+
+@pytest.mark.parametrize(
+    ("hours", "rate", "rate_str", "payout_str"),
+    [
+        # Half-cent amounts round to the even unit, matching Decimal's default
+        pytest.param(1, 4050, "40", "$40", id="half_rounds_down"),
+        pytest.param(1, 4150, "42", "$42", id="half_rounds_up"),
+        pytest.param(3, 1250, "12", "$38", id="rate_down_payout_up"),
+        pytest.param(3, 1150, "12", "$34", id="rate_up_payout_down"),
+        pytest.param(1, 4049, "40", "$40", id="below_half"),
+        pytest.param(1, 4051, "41", "$41", id="above_half"),
+    ],
+)
+def test_payout_console_formatter_rounds_half_to_even(
+    payout_generator: PayoutReportGenerator,
+    payout_formatter: PayoutConsoleFormatter,
+    make_employees: "MakeEmployees",
+    hours: int,
+    rate: int,
+    rate_str: str,
+    payout_str: str,
+) -> None:
+    """Test that rates and payouts are rounded half to even for display."""
+    report_data = payout_generator.generate(
+        make_employees([("1", "r@example.com", "Rounding", "Ops", hours, rate)])
+    )
+    employee_line, total_line = payout_formatter.format(report_data).splitlines()[1:]
+
+    assert employee_line.split()[-3:] == [str(hours), rate_str, payout_str]
+    assert total_line.split() == [str(hours), payout_str]
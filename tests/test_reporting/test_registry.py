@@ -1,8 +1,16 @@
 """Tests for the report registry."""
 
+import re
+from pathlib import Path
+
 import pytest
 
 from salary_reporter.exceptions import UnsupportedReportTypeError
+from salary_reporter.reporting import registry
+from salary_reporter.reporting.base import (
+    ReportFormatterStrategy,
+    ReportGeneratorStrategy,
+)
 from salary_reporter.reporting.payout_report import (
     PayoutConsoleFormatter,
     PayoutReportGenerator,
@@ -25,10 +33,12 @@ def test_get_report_configuration_payout():
 
 def test_get_report_configuration_unsupported():
     """Test retrieving configuration for an unsupported report type."""
-    with pytest.raises(UnsupportedReportTypeError) as excinfo:
+    # Ensure available reports are listed after the error
+    with pytest.raises(
+        UnsupportedReportTypeError,
+        match=r"Report type 'unknown_report' is not supported.*payout",
+    ):
         get_report_configuration("unknown_report")
-    assert "Report type 'unknown_report' is not supported" in str(excinfo.value)
-    assert "payout" in str(excinfo.value)  # Ensure available reports are listed
 
 
 def test_get_available_reports():
@@ -36,3 +46,50 @@ def test_get_available_reports():
     available = get_available_reports()
     assert "payout" in available
     assert isinstance(available, list)
+
+
+@pytest.mark.parametrize("report_name", get_available_reports())
+def test_registered_reports_resolve(report_name: str) -> None:
+    """Test that every registry entry points at importable strategy classes."""
+    config = get_report_configuration(report_name)
+    assert issubclass(config.generator_cls, ReportGeneratorStrategy)
+    assert issubclass(config.formatter_cls, ReportFormatterStrategy)
+
+
+@pytest.mark.parametrize(
+    "class_path",
+    [
+        pytest.param(
+            "salary_reporter.reporting.payout_report:MissingClass",
+            id="missing_class",
+        ),
+        pytest.param("salary_reporter.reporting.no_such_module:Cls", id="no_module"),
+        pytest.param("no_such_package.report:Cls", id="no_package"),
+        pytest.param("salary_reporter.reporting.payout_report", id="no_colon"),
+    ],
+)
+def test_get_report_configuration_broken_entry(
+    monkeypatch: pytest.MonkeyPatch, class_path: str
+) -> None:
+    """Test that a bad registry entry raises UnsupportedReportTypeError."""
+    monkeypatch.setitem(registry._REPORT_REGISTRY, "broken", (class_path, class_path))
+    with pytest.raises(
+        UnsupportedReportTypeError, match=f"Report class '{re.escape(class_path)}'"
+    ):
+        get_report_configuration("broken")
+
+
+def test_get_report_configuration_import_error_in_report_module(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that an import failure inside a report module is not masked."""
+    (tmp_path / "report_with_missing_dep.py").write_text(
+        "import missing_third_party_dependency\n", encoding="utf-8"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    class_path = "report_with_missing_dep:Generator"
+    monkeypatch.setitem(registry._REPORT_REGISTRY, "broken", (class_path, class_path))
+
+    with pytest.raises(ModuleNotFoundError) as excinfo:
+        get_report_configuration("broken")
+    assert excinfo.value.name == "missing_third_party_dependency"